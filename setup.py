@@ -0,0 +1,19 @@
+"""
+Optional build of the Cython integration core (src/sim_sir_core.pyx).
+
+The simulation runs fine without it (sim_sir falls back to numba or pure
+Python); building the extension gives native-loop performance with no
+JIT warm-up:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name="sir-simulation",
+    package_dir={"": "src"},
+    ext_modules=cythonize("src/sim_sir_core.pyx", language_level=3),
+)
@@ -9,6 +9,34 @@ import numpy as np
 import numpy.typing as npt
 import config
 
+# Numba is optional: when available the step loops below are JIT-compiled
+# to native code (the loops are pure scalar Python, exactly the pattern
+# numba handles best). Without it the same functions run as plain Python.
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:  # numba not installed - fall back to pure Python
+    _HAS_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op replacement for numba.njit when numba is unavailable."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+
+        def wrap(func):
+            return func
+
+        return wrap
+
+# The Cython extension (see setup.py / sim_sir_core.pyx) is preferred over
+# the numba kernels when built: same loops compiled ahead of time, so
+# there is no JIT warm-up on first call
+try:
+    import sim_sir_core as _core
+except ImportError:  # extension not built - use the numba/Python kernels
+    _core = None
+
 
 def sir_derivatives(S: float, I: float, R: float, beta: float, gamma: float) -> Tuple[float, float, float]:
     """
@@ -23,24 +51,117 @@ def sir_derivatives(S: float, I: float, R: float, beta: float, gamma: float) ->
         S, I, R: Current population in each compartment
         beta: Transmission rate (how easily the trend spreads)
         gamma: Recovery rate (how quickly people stop spreading)
-    
+
     Returns:
         (dS/dt, dI/dt, dR/dt): Rate of change for each compartment
+
+    Note:
+        This is the reference definition of the SIR right-hand side, kept
+        as public API. The integration kernels inline these expressions
+        instead of calling it, avoiding a function call and a tuple
+        allocation on every step.
     """
     # Total population (remains constant throughout simulation)
     N = S + I + R
-    
-    # Rate of new infections: proportional to S*I interactions
-    # Divided by N to get the contact probability
-    dS = -beta * S * I / N
-    
-    # Infected change: gain new infections, lose to recovery
-    dI = beta * S * I / N - gamma * I
-    
+
+    # Rate of new infections: proportional to S*I interactions,
+    # divided by N to get the contact probability
+    infection = beta * S * I / N
+
     # Recovery rate: proportional to current infected
-    dR = gamma * I
-    
-    return dS, dI, dR
+    recovery = gamma * I
+
+    # Each term is computed once and reused: susceptibles lose to
+    # infection, infected gain it and lose to recovery
+    return -infection, infection - recovery, recovery
+
+
+@njit(cache=True, fastmath=True)
+def _run_euler(S0, I0, R0, beta, gamma, dt, steps, traj):
+    """Euler step loop; compiled to native code when numba is available.
+
+    Fills the caller-allocated `(steps+1, 3)` trajectory array `traj`
+    (columns S, I, R) in place.
+    """
+    traj[0, 0], traj[0, 1], traj[0, 2] = S0, I0, R0
+
+    s, i, r = S0, I0, R0
+    for k in range(steps):
+        si_over_N = beta * s * i / (s + i + r)
+        gi = gamma * i
+
+        s = s - dt * si_over_N
+        i = i + dt * (si_over_N - gi)
+        r = r + dt * gi
+
+        # Clamp negative populations from numerical errors; the conditional
+        # expression lowers to a single branchless max instruction under
+        # numba instead of a call to the Python max() built-in
+        s = s if s > 0.0 else 0.0
+        i = i if i > 0.0 else 0.0
+        r = r if r > 0.0 else 0.0
+
+        # One cache-line-friendly row write per step
+        traj[k + 1, 0] = s
+        traj[k + 1, 1] = i
+        traj[k + 1, 2] = r
+
+
+@njit(cache=True, fastmath=True)
+def _run_rk4(S0, I0, R0, beta, gamma, dt, steps, traj):
+    """Classical RK4 step loop; compiled to native code when numba is available.
+
+    Fills the caller-allocated `(steps+1, 3)` trajectory array `traj`
+    (columns S, I, R) in place.
+    """
+    traj[0, 0], traj[0, 1], traj[0, 2] = S0, I0, R0
+
+    s, i, r = S0, I0, R0
+    for k in range(steps):
+        # Sample the derivative at the start, twice at the midpoint and at
+        # the end of the step (SIR right-hand side inlined at each sample)
+        n1 = beta * s * i / (s + i + r)
+        g1 = gamma * i
+        k1s, k1i, k1r = -n1, n1 - g1, g1
+
+        s2 = s + 0.5 * dt * k1s
+        i2 = i + 0.5 * dt * k1i
+        r2 = r + 0.5 * dt * k1r
+        n2 = beta * s2 * i2 / (s2 + i2 + r2)
+        g2 = gamma * i2
+        k2s, k2i, k2r = -n2, n2 - g2, g2
+
+        s3 = s + 0.5 * dt * k2s
+        i3 = i + 0.5 * dt * k2i
+        r3 = r + 0.5 * dt * k2r
+        n3 = beta * s3 * i3 / (s3 + i3 + r3)
+        g3 = gamma * i3
+        k3s, k3i, k3r = -n3, n3 - g3, g3
+
+        s4 = s + dt * k3s
+        i4 = i + dt * k3i
+        r4 = r + dt * k3r
+        n4 = beta * s4 * i4 / (s4 + i4 + r4)
+        g4 = gamma * i4
+        k4s, k4i, k4r = -n4, n4 - g4, g4
+
+        # Combine the samples with weights 1/6, 2/6, 2/6, 1/6
+        s = s + dt * (k1s + 2.0 * k2s + 2.0 * k3s + k4s) / 6.0
+        i = i + dt * (k1i + 2.0 * k2i + 2.0 * k3i + k4i) / 6.0
+        r = r + dt * (k1r + 2.0 * k2r + 2.0 * k3r + k4r) / 6.0
+
+        # Clamp negative populations from numerical errors; the conditional
+        # expression lowers to a single branchless max instruction under
+        # numba instead of a call to the Python max() built-in
+        s = s if s > 0.0 else 0.0
+        i = i if i > 0.0 else 0.0
+        r = r if r > 0.0 else 0.0
+
+        # One cache-line-friendly row write per step
+        traj[k + 1, 0] = s
+        traj[k + 1, 1] = i
+        traj[k + 1, 2] = r
+
 
 def simulate_sir(
     S0: float,
@@ -50,50 +171,303 @@ def simulate_sir(
     gamma: float,
     dt: float,
     steps: int,
+    method: str = "rk4",
+    dtype: npt.DTypeLike = np.float32,
 ) -> Tuple[npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray]:
     """
-    Simulate the SIR model over time using Euler's numerical method.
-    
-    Euler's method approximates the solution to differential equations by:
-    new_value = old_value + (rate_of_change * time_step)
-    
+    Simulate the SIR model over time, sampled on a uniform time grid.
+
+    Three integrators are available:
+    - "rk4" (default): classical 4th-order Runge-Kutta. Error is O(dt^4),
+      so the same accuracy as Euler is reached with a much larger dt
+      (and therefore far fewer steps).
+    - "euler": first-order Euler, new_value = old_value + rate * dt.
+      Simple but error is only O(dt); kept for teaching and comparison.
+    - "lsoda": adaptive step-size control via scipy's compiled LSODA
+      solver; it spends few steps in the flat regions and refines around
+      the peak, and switches to a stiff method when needed. Results are
+      still sampled at the same steps+1 uniform time points. Requires
+      scipy.
+
     Parameters:
         S0, I0, R0: Initial population in each compartment
         beta: Transmission rate (0 to 1+)
         gamma: Recovery rate (0 to 1)
         dt: Time step size (smaller = more accurate)
         steps: Number of simulation steps
-    
+        method: Integration scheme, "rk4", "euler" or "lsoda"
+        dtype: Storage dtype of the trajectory. float32 (default) halves
+            memory traffic and is plenty for population counts; pass
+            np.float64 if full double precision is needed
+
     Returns:
         t: Time array
         S, I, R: Population arrays for each compartment over time
+            (views into one contiguous (steps+1, 3) trajectory array)
+    """
+    if method not in ("rk4", "euler", "lsoda"):
+        raise ValueError(f"Unknown method {method!r}; expected 'rk4', 'euler' or 'lsoda'")
+
+    # One fused (steps+1, 3) array keeps the S/I/R samples of each step on
+    # the same cache line instead of scattered across three allocations.
+    # The integration itself still runs in double precision scalars; only
+    # the stored samples are narrowed to `dtype`.
+    t = np.arange(steps + 1) * dt
+    traj = np.empty((steps + 1, 3), dtype=dtype)
+
+    if method == "lsoda":
+        try:
+            from scipy.integrate import solve_ivp
+        except ImportError as exc:
+            raise ImportError("method='lsoda' requires scipy to be installed") from exc
+
+        # Adaptive solver chooses its own internal steps; dense output is
+        # sampled back onto the uniform grid so callers see the usual shape
+        sol = solve_ivp(
+            lambda _t, y: sir_derivatives(y[0], y[1], y[2], beta, gamma),
+            (0.0, steps * dt), [S0, I0, R0],
+            method="LSODA", t_eval=t, rtol=1e-6,
+        )
+        traj[:] = sol.y.T
+        # Clamp negative populations from numerical errors
+        np.maximum(traj, 0.0, out=traj)
+    else:
+        # The step loops live in compiled kernels (Cython extension when
+        # built, otherwise the numba-jitted functions); the state stays in
+        # plain scalars inside and each array slot is written exactly once
+        # per step.
+        if _core is not None:
+            run = _core.simulate_rk4 if method == "rk4" else _core.simulate_euler
+        else:
+            run = _run_rk4 if method == "rk4" else _run_euler
+        run(float(S0), float(I0), float(R0), float(beta), float(gamma), float(dt), steps, traj)
+
+    return t, traj[:, 0], traj[:, 1], traj[:, 2]
+
+
+def simulate_sir_batch(
+    S0: float,
+    I0: float,
+    R0: float,
+    betas: npt.ArrayLike,
+    gammas: npt.ArrayLike,
+    dt: float,
+    steps: int,
+) -> Tuple[npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray]:
+    """
+    Simulate many SIR parameter combinations at once with NumPy.
+
+    All (beta, gamma) pairs share the same initial conditions and advance
+    in lock-step with Euler's method, so one Python loop of length `steps`
+    is amortized over the whole batch — each iteration is a handful of
+    vectorized array operations instead of per-trajectory Python work.
+
+    Because the total population N is conserved, only S and I are
+    integrated; R is recovered afterwards as N - S - I.
+
+    Parameters:
+        S0, I0, R0: Initial population in each compartment (shared)
+        betas, gammas: 1D arrays (or scalars) of transmission and recovery
+            rates; broadcast against each other to form the batch
+        dt: Time step size
+        steps: Number of simulation steps
+
+    Returns:
+        t: Time array, shape (steps + 1,)
+        S, I, R: Population arrays, shape (batch, steps + 1)
     """
-    # Initialize arrays to store results at each time step
-    t = np.zeros(steps + 1)  # Time points
-    S = np.zeros(steps + 1)  # Susceptible over time
-    I = np.zeros(steps + 1)  # Infected over time
-    R = np.zeros(steps + 1)  # Recovered over time
+    betas, gammas = np.broadcast_arrays(
+        np.asarray(betas, dtype=np.float64), np.asarray(gammas, dtype=np.float64)
+    )
+    betas = betas.ravel()
+    gammas = gammas.ravel()
+    batch = betas.size
+
+    N = float(S0) + float(I0) + float(R0)
+    t = np.arange(steps + 1) * dt
+    S = np.empty((batch, steps + 1))
+    I = np.empty((batch, steps + 1))
 
-    # Set initial conditions at time t=0
-    S[0], I[0], R[0] = S0, I0, R0
+    # Per-trajectory state, one lane per parameter combination
+    s = np.full(batch, float(S0))
+    i = np.full(batch, float(I0))
+    S[:, 0] = s
+    I[:, 0] = i
+
+    # Scratch buffers reused every iteration so the loop allocates nothing
+    infection = np.empty(batch)
+    recovery = np.empty(batch)
 
-    # Simulate each time step using Euler's method
     for k in range(steps):
-        # Calculate rates of change at current state
-        dS, dI, dR = sir_derivatives(S[k], I[k], R[k], beta, gamma)
+        # infection = beta*S*I/N, recovery = gamma*I across all lanes
+        np.multiply(betas, s, out=infection)
+        infection *= i
+        infection /= N
+        np.multiply(gammas, i, out=recovery)
+
+        s -= dt * infection
+        infection -= recovery
+        i += dt * infection
 
-        # Euler's method: new = old + rate * dt
-        S[k + 1] = S[k] + dt * dS
-        I[k + 1] = I[k] + dt * dI
-        R[k + 1] = R[k] + dt * dR
-        t[k + 1] = t[k] + dt
+        # Clamp negative populations from numerical errors
+        np.maximum(s, 0.0, out=s)
+        np.maximum(i, 0.0, out=i)
 
-        # Prevent negative populations (can occur due to numerical errors)
-        S[k + 1] = max(S[k + 1], 0.0)
-        I[k + 1] = max(I[k + 1], 0.0)
-        R[k + 1] = max(R[k + 1], 0.0)
+        S[:, k + 1] = s
+        I[:, k + 1] = i
 
+    R = N - S - I
     return t, S, I, R
+
+
+def sir_final_size(S0: float, I0: float, R0: float, beta: float, gamma: float) -> float:
+    """
+    Final epidemic size R∞ without running the simulation.
+
+    As t -> infinity the infected compartment empties and the SIR system
+    satisfies the final-size relation
+
+        R∞ = N - S0 * exp(-(beta/gamma) * (R∞ - R0) / N)
+
+    which is solved here with a few Newton iterations (quadratic
+    convergence, typically 3-4 steps). O(1) replacement for integrating
+    the whole trajectory when only the end state is needed.
+
+    Parameters:
+        S0, I0, R0: Initial population in each compartment
+        beta: Transmission rate
+        gamma: Recovery rate
+
+    Returns:
+        R∞: Total recovered population at equilibrium
+    """
+    # With nobody infected the system is already at its disease-free
+    # equilibrium; Newton from R=N would converge to the epidemic root
+    # of the final-size relation instead
+    if I0 <= 0:
+        return float(R0)
+
+    N = S0 + I0 + R0
+    ratio = beta / gamma
+
+    # f(R) = N - S0*exp(-ratio*(R - R0)/N) - R has a root in [R0, N];
+    # start from the upper end, where f is negative
+    R = float(N)
+    for _ in range(50):
+        e = S0 * np.exp(-ratio * (R - R0) / N)
+        f = N - e - R
+        fprime = ratio * e / N - 1.0
+        step = f / fprime
+        R -= step
+        if abs(step) < 1e-12 * N:
+            break
+    return R
+
+
+def sir_peak_infected(S0: float, I0: float, R0: float, beta: float, gamma: float) -> float:
+    """
+    Peak of the infected curve without running the simulation.
+
+    Along a trajectory I + S - rho*ln(S) is conserved (rho = gamma*N/beta),
+    and I is maximal when S falls to rho, giving the closed form
+
+        I_peak = I0 + S0 - rho + rho * ln(rho / S0)
+
+    If S0 is already at or below rho the infection only declines and the
+    peak is simply I0. O(1) replacement for integrating the trajectory
+    when only the summary statistic is needed.
+
+    Parameters:
+        S0, I0, R0: Initial population in each compartment
+        beta: Transmission rate
+        gamma: Recovery rate
+
+    Returns:
+        Maximum infected population along the trajectory
+    """
+    # With nobody infected the trajectory stays flat at I=0; the closed
+    # form below assumes an epidemic actually unfolds
+    if I0 <= 0:
+        return float(I0)
+
+    N = S0 + I0 + R0
+    rho = gamma * N / beta
+    if S0 <= rho:
+        return float(I0)
+    return float(I0 + S0 - rho + rho * np.log(rho / S0))
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _run_sweep(S0, I0, R0, betas, gammas, dt, steps, out):
+    """Parallel Euler sweep kernel: one independent trajectory per lane.
+
+    Fills the caller-allocated `(batch, steps+1, 3)` array `out`
+    (last axis S, I, R); prange spreads the lanes across threads.
+    """
+    for b in prange(betas.size):
+        beta = betas[b]
+        gamma = gammas[b]
+        s, i, r = S0, I0, R0
+        out[b, 0, 0], out[b, 0, 1], out[b, 0, 2] = s, i, r
+
+        for k in range(steps):
+            si_over_N = beta * s * i / (s + i + r)
+            gi = gamma * i
+
+            s = s - dt * si_over_N
+            i = i + dt * (si_over_N - gi)
+            r = r + dt * gi
+
+            # Clamp negative populations from numerical errors
+            s = s if s > 0.0 else 0.0
+            i = i if i > 0.0 else 0.0
+            r = r if r > 0.0 else 0.0
+
+            out[b, k + 1, 0] = s
+            out[b, k + 1, 1] = i
+            out[b, k + 1, 2] = r
+
+
+def simulate_sir_sweep(
+    S0: float,
+    I0: float,
+    R0: float,
+    betas: npt.ArrayLike,
+    gammas: npt.ArrayLike,
+    dt: float,
+    steps: int,
+    dtype: npt.DTypeLike = np.float32,
+) -> Tuple[npt.NDArray, npt.NDArray, npt.NDArray, npt.NDArray]:
+    """
+    Multi-threaded variant of simulate_sir_batch for large parameter sweeps.
+
+    Each (beta, gamma) combination is an independent Euler trajectory, so
+    the batch axis parallelizes perfectly: the numba kernel spreads lanes
+    across threads with prange, and fastmath lets LLVM vectorize the
+    arithmetic within each thread (its reassociation means results can
+    differ from simulate_sir_batch in the last few ulps). Without numba
+    this delegates to the NumPy-vectorized simulate_sir_batch, which is
+    single-threaded but still avoids per-trajectory Python work.
+
+    Parameters and return shapes match simulate_sir_batch, plus:
+        dtype: Storage dtype of the trajectories (default float32)
+    """
+    betas, gammas = np.broadcast_arrays(
+        np.asarray(betas, dtype=np.float64), np.asarray(gammas, dtype=np.float64)
+    )
+    betas = np.ascontiguousarray(betas.ravel())
+    gammas = np.ascontiguousarray(gammas.ravel())
+
+    if not _HAS_NUMBA:
+        t, S, I, R = simulate_sir_batch(S0, I0, R0, betas, gammas, dt, steps)
+        return t, S.astype(dtype, copy=False), I.astype(dtype, copy=False), R.astype(dtype, copy=False)
+
+    t = np.arange(steps + 1) * dt
+    out = np.empty((betas.size, steps + 1, 3), dtype=dtype)
+    _run_sweep(float(S0), float(I0), float(R0), betas, gammas, float(dt), steps, out)
+    return t, out[:, :, 0], out[:, :, 1], out[:, :, 2]
+
+
 def main() -> None:
     """Run the SIR simulation with default parameters."""
     # Run the simulation using parameters from config.py
@@ -0,0 +1,106 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True, language_level=3
+"""
+Cython integration core for the SIR model.
+
+Compiled alternative to the numba-jitted loops in sim_sir.py: a plain C
+loop with no JIT warm-up cost, which matters when simulate_sir is called
+many times from a sweep driver. Build in place with:
+
+    python setup.py build_ext --inplace
+
+sim_sir falls back to the numba/pure-Python kernels when this extension
+has not been built.
+"""
+
+# Accept both float32 (simulate_sir's default storage) and float64 buffers
+ctypedef fused floating:
+    float
+    double
+
+
+def simulate_euler(double S0, double I0, double R0, double beta,
+                   double gamma, double dt, Py_ssize_t steps,
+                   floating[:, ::1] traj):
+    """Euler step loop filling the caller-allocated (steps+1, 3) trajectory."""
+    cdef double s = S0, i = I0, r = R0
+    cdef double si_over_N, gi
+    cdef Py_ssize_t k
+
+    traj[0, 0] = <floating> S0
+    traj[0, 1] = <floating> I0
+    traj[0, 2] = <floating> R0
+
+    for k in range(steps):
+        si_over_N = beta * s * i / (s + i + r)
+        gi = gamma * i
+
+        s = s - dt * si_over_N
+        i = i + dt * (si_over_N - gi)
+        r = r + dt * gi
+
+        # Clamp negative populations from numerical errors
+        s = s if s > 0.0 else 0.0
+        i = i if i > 0.0 else 0.0
+        r = r if r > 0.0 else 0.0
+
+        traj[k + 1, 0] = <floating> s
+        traj[k + 1, 1] = <floating> i
+        traj[k + 1, 2] = <floating> r
+
+
+def simulate_rk4(double S0, double I0, double R0, double beta,
+                 double gamma, double dt, Py_ssize_t steps,
+                 floating[:, ::1] traj):
+    """Classical RK4 step loop filling the caller-allocated (steps+1, 3) trajectory."""
+    cdef double s = S0, i = I0, r = R0
+    cdef double n1, g1, k1s, k1i, k1r
+    cdef double s2, i2, r2, n2, g2, k2s, k2i, k2r
+    cdef double s3, i3, r3, n3, g3, k3s, k3i, k3r
+    cdef double s4, i4, r4, n4, g4, k4s, k4i, k4r
+    cdef Py_ssize_t k
+
+    traj[0, 0] = <floating> S0
+    traj[0, 1] = <floating> I0
+    traj[0, 2] = <floating> R0
+
+    for k in range(steps):
+        # Sample the derivative at the start, twice at the midpoint and at
+        # the end of the step (SIR right-hand side inlined at each sample)
+        n1 = beta * s * i / (s + i + r)
+        g1 = gamma * i
+        k1s = -n1; k1i = n1 - g1; k1r = g1
+
+        s2 = s + 0.5 * dt * k1s
+        i2 = i + 0.5 * dt * k1i
+        r2 = r + 0.5 * dt * k1r
+        n2 = beta * s2 * i2 / (s2 + i2 + r2)
+        g2 = gamma * i2
+        k2s = -n2; k2i = n2 - g2; k2r = g2
+
+        s3 = s + 0.5 * dt * k2s
+        i3 = i + 0.5 * dt * k2i
+        r3 = r + 0.5 * dt * k2r
+        n3 = beta * s3 * i3 / (s3 + i3 + r3)
+        g3 = gamma * i3
+        k3s = -n3; k3i = n3 - g3; k3r = g3
+
+        s4 = s + dt * k3s
+        i4 = i + dt * k3i
+        r4 = r + dt * k3r
+        n4 = beta * s4 * i4 / (s4 + i4 + r4)
+        g4 = gamma * i4
+        k4s = -n4; k4i = n4 - g4; k4r = g4
+
+        # Combine the samples with weights 1/6, 2/6, 2/6, 1/6
+        s = s + dt * (k1s + 2.0 * k2s + 2.0 * k3s + k4s) / 6.0
+        i = i + dt * (k1i + 2.0 * k2i + 2.0 * k3i + k4i) / 6.0
+        r = r + dt * (k1r + 2.0 * k2r + 2.0 * k3r + k4r) / 6.0
+
+        # Clamp negative populations from numerical errors
+        s = s if s > 0.0 else 0.0
+        i = i if i > 0.0 else 0.0
+        r = r if r > 0.0 else 0.0
+
+        traj[k + 1, 0] = <floating> s
+        traj[k + 1, 1] = <floating> i
+        traj[k + 1, 2] = <floating> r